@@ -1,9 +1,143 @@
-import re
 import json
+import logging
+import os
+import re
+import shelve
 import sys
+import threading
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from urllib.parse import urlparse, parse_qs
 from yt_dlp import YoutubeDL
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled
+
+try:
+    import orjson                   # much faster JSON encoding, if available
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np              # packed transcript timestamps, if available
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Pre-compiled shape check for YouTube video IDs: exactly 11 characters
+# from [A-Za-z0-9_-]. fullmatch anchors both ends, so no scanning occurs.
+_VALID_ID_RE = re.compile(r'[0-9A-Za-z_-]{11}')
+
+# Hostnames accepted for extraction; anything else fails fast instead of
+# wasting a doomed yt-dlp network call
+_YOUTUBE_HOSTNAMES = {
+    'www.youtube.com', 'youtube.com', 'm.youtube.com',
+    'music.youtube.com', 'youtu.be',
+}
+
+# Default transcript languages in order of preference (English, then Hindi)
+DEFAULT_TRANSCRIPT_LANGUAGES = ['en', 'hi']
+
+# Shared yt-dlp instance, reused across calls (and threads) so setup cost is
+# paid once. Options are trimmed to metadata-only work: no download, and no
+# DASH/HLS manifest resolution since we never touch formats.
+_YDL = YoutubeDL({
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'ignoreerrors': True,
+    'youtube_include_dash_manifest': False,
+    'youtube_include_hls_manifest': False,
+})
+
+# Flat variant for listing playlist/channel entries: returns entry IDs and
+# titles from the index page alone, without touching any per-video page
+_YDL_FLAT = YoutubeDL({
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'ignoreerrors': True,
+    'extract_flat': True,
+})
+
+# C-level getter for transcript segment text; with map() this keeps the
+# per-segment work out of the bytecode loop when joining long transcripts
+_get_text = itemgetter("text")
+
+# Output metadata field -> yt-dlp info field
+_FIELD_MAP = (
+    ("title", "title"),
+    ("description", "description"),
+    ("views", "view_count"),
+    ("publish_date", "upload_date"),
+    ("length", "duration"),
+    ("author", "uploader"),
+    ("channel_id", "channel_id"),
+    ("channel_url", "channel_url"),
+    ("thumbnail_url", "thumbnail"),
+    ("categories", "categories"),
+    ("tags", "tags"),
+    ("likes", "like_count"),
+)
+
+# On-disk cache for yt-dlp metadata and transcripts. Both are idempotent per
+# video ID, so repeat runs read from disk instead of re-hitting YouTube.
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'audience-jugaad')
+_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # refetch entries older than a week
+_CACHE_LOCK = threading.Lock()     # shelve is not safe for concurrent access
+
+# Retry policy when YouTube rate-limits us (HTTP 429): back off and try
+# again a few times before giving up on that URL
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF = 5.0          # initial delay in seconds, doubled per retry
+
+# In-memory negative cache: video IDs recently confirmed to have no
+# transcript, so re-queries skip the list_transcripts round-trip for a while
+_NO_TRANSCRIPT_TTL = 3600          # seconds before re-checking such a video
+_NO_TRANSCRIPT_MAX = 10_000        # size bound for long-running batch use
+_no_transcript_until = {}          # video_id -> expiry timestamp
+
+def _cache_get(key):
+    """
+    Look up a cached value by key.
+
+    Args:
+        key (str): Cache key
+
+    Returns:
+        The cached value, or None if missing or older than _CACHE_MAX_AGE
+
+    Expired entries are deleted on lookup so the shelve does not keep
+    growing with keys that are never refetched.
+    """
+    try:
+        with _CACHE_LOCK, shelve.open(os.path.join(_CACHE_DIR, 'metadata')) as db:
+            entry = db.get(key)
+            if entry and time.time() - entry['time'] >= _CACHE_MAX_AGE:
+                del db[key]
+                entry = None
+    except OSError:
+        return None
+    if entry:
+        return entry['value']
+    return None
+
+def _cache_set(key, value):
+    """
+    Store a value in the on-disk cache, ignoring cache I/O failures.
+
+    Args:
+        key (str): Cache key
+        value: Picklable value to store
+    """
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with _CACHE_LOCK, shelve.open(os.path.join(_CACHE_DIR, 'metadata')) as db:
+            db[key] = {'time': time.time(), 'value': value}
+    except OSError:
+        pass
 
 def extract_video_id(url):
     """
@@ -13,19 +147,85 @@ def extract_video_id(url):
     Returns:
         str: YouTube video ID or None if not found
     """
-    # Regular expression to match YouTube video IDs from various URL formats
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',      # Matches YouTube standard URLs
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',      # Matches embedded video URLs
-        r'(?:youtu\.be\/)([0-9A-Za-z_-]{11})'   # Matches short URLs
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)               # Returns the extracted video ID
+    # Reject obviously invalid input (empty, absurdly long, or not a YouTube
+    # URL at all) with O(1) string checks before doing any URL parsing
+    if not url or len(url) > 512 or 'youtu' not in url:
+        return None
+
+    # Scheme-less URLs parse with the host inside the path and no hostname;
+    # give them a scheme so every branch below sees the same structure
+    if '//' not in url:
+        url = 'https://' + url
+
+    # YouTube URLs have a fixed grammar, so plain URL parsing beats a regex:
+    # short URLs carry the ID as the path, embed/shorts/live and legacy /v/
+    # URLs as the second path segment, and standard watch URLs in the 'v'
+    # query parameter
+    parsed = urlparse(url)
+    if parsed.hostname and 'youtu.be' in parsed.hostname:
+        video_id = parsed.path.lstrip('/')[:11]
+    elif parsed.path.startswith(('/embed/', '/shorts/', '/live/', '/v/')):
+        video_id = parsed.path.split('/')[2][:11]
+    else:
+        video_id = parse_qs(parsed.query).get('v', [''])[0][:11]
+
+    if _VALID_ID_RE.fullmatch(video_id):
+        return video_id
     return None                                 # Returns None if no valid ID is found
 
+def _is_rate_limit_error(e):
+    """
+    Check whether an exception looks like a YouTube 429 / rate limit.
+
+    Both yt-dlp and youtube-transcript-api surface throttling as exceptions
+    whose type name or message mentions 429 / Too Many Requests.
+
+    Args:
+        e (Exception): The exception to inspect
+
+    Returns:
+        bool: True if the error indicates rate limiting
+    """
+    text = f"{type(e).__name__}: {e}"
+    return '429' in text or 'Too Many Requests' in text or 'TooManyRequests' in text
+
+def _mark_no_transcript(video_id):
+    """
+    Record a video as transcript-less, keeping the negative cache bounded.
+
+    Args:
+        video_id (str): YouTube video ID
+    """
+    now = time.time()
+    if len(_no_transcript_until) >= _NO_TRANSCRIPT_MAX:
+        # Drop expired entries first; if everything is still live, evict the
+        # oldest insertions (dicts preserve insertion order)
+        for vid, expiry in list(_no_transcript_until.items()):
+            if expiry <= now:
+                _no_transcript_until.pop(vid, None)
+        while len(_no_transcript_until) >= _NO_TRANSCRIPT_MAX:
+            _no_transcript_until.pop(next(iter(_no_transcript_until)), None)
+    _no_transcript_until[video_id] = now + _NO_TRANSCRIPT_TTL
+
+def _fetch_transcript_data(transcript):
+    """
+    Fetch a transcript track and normalize the result to raw segment dicts.
+
+    youtube-transcript-api >= 1.0 returns a FetchedTranscript of snippet
+    objects instead of dicts; to_raw_data() recovers the list-of-dicts shape
+    that older versions return directly.
+
+    Args:
+        transcript: Transcript track from the listed transcript_list
+
+    Returns:
+        list: Segment dicts with 'text', 'start' and 'duration'
+    """
+    data = transcript.fetch()
+    if hasattr(data, 'to_raw_data'):
+        data = data.to_raw_data()
+    return data
+
 def get_video_transcript(video_id, languages=None):
     """
     Get the transcript/captions for a YouTube video in preferred languages.
@@ -34,119 +234,307 @@ def get_video_transcript(video_id, languages=None):
         video_id (str): YouTube video ID
         languages (list): List of language codes to try in order of preference.
                          Default is ['en', 'hi']
-    
+
     Returns:
-        tuple: (transcript list, language code) or (None, None) if not available
+        tuple: (list of segment dicts with 'text', 'start' and 'duration',
+               language code) or (None, None) if not available. The segment
+               shape is normalized regardless of youtube-transcript-api
+               version, so downstream code handles a single type.
     """
     if languages is None:
-        languages = ['en', 'hi']  # Try English first, then Hindi
-    
+        languages = DEFAULT_TRANSCRIPT_LANGUAGES
+
+    # Skip the network entirely for videos recently confirmed transcript-less;
+    # drop the entry once it has expired so the cache does not accumulate
+    expiry = _no_transcript_until.get(video_id)
+    if expiry is not None:
+        if expiry > time.time():
+            return None, None
+        _no_transcript_until.pop(video_id, None)
+
     try:
-        # First, get available transcript languages
+        # Fetch the available transcript list once; every lookup below reuses
+        # it so only the final .fetch() hits the network again
         transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        
-        # Try to get transcript in preferred languages
+
+        # Index the available tracks by language once, so a missing preferred
+        # language is a cheap dict miss rather than a raised-and-swallowed
+        # exception. Manual tracks are listed first, so setdefault keeps the
+        # manual one when a language also has an auto-generated track.
+        available = {}
+        for transcript in transcript_list:
+            available.setdefault(transcript.language_code, transcript)
+
+        # Try to get a transcript in one of the preferred languages
         for lang in languages:
-            try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=[lang])
-                return transcript, lang
-            except Exception as e:
-                # If specific language not found, continue to next language
-                continue
+            transcript = available.get(lang)
+            if transcript is not None:
+                return _fetch_transcript_data(transcript), lang
 
-        # If preferred languages aren't available, try to get any manual transcript
-        try:
-            # Get the first available manual transcript
-            for transcript in transcript_list:
-                if not transcript.is_generated:
-                    data = transcript.fetch()
-                    return data, transcript.language_code
-        except:
-            pass
-
-        # Try to get any generated transcript
-        try:
-            # Get the first available auto-generated transcript
+        # If preferred languages aren't available, try to get any manual
+        # transcript, then any auto-generated one
+        for transcript in available.values():
+            if not transcript.is_generated:
+                return _fetch_transcript_data(transcript), transcript.language_code
+        for transcript in available.values():
+            if transcript.is_generated:
+                return _fetch_transcript_data(transcript), transcript.language_code
+
+        # Guard so the listing work is skipped entirely when INFO is disabled,
+        # e.g. when used as a library from a batch worker
+        if logger.isEnabledFor(logging.INFO):
+            listing = []
             for transcript in transcript_list:
-                if transcript.is_generated:
-                    data = transcript.fetch()
-                    return data, transcript.language_code
-        except:
-            pass
+                lang_info = f"{transcript.language_code} "
+                lang_info += "(GENERATED)" if transcript.is_generated else "(MANUALLY CREATED)"
+                lang_info += "[TRANSLATABLE]" if transcript.is_translatable else ""
+                listing.append(f" - {lang_info}")
+            logger.info("Available transcript languages:\n%s", "\n".join(listing))
 
-        print("Available transcript languages:")
-        for transcript in transcript_list:
-            lang_info = f"{transcript.language_code} "
-            lang_info += "(GENERATED)" if transcript.is_generated else "(MANUALLY CREATED)"
-            lang_info += "[TRANSLATABLE]" if transcript.is_translatable else ""
-            print(f" - {lang_info}")
-            
+        _mark_no_transcript(video_id)
+        return None, None
+
+    except TranscriptsDisabled:
+        # Captions are switched off for this video; a definitive answer that
+        # will not change soon, so remember it
+        _mark_no_transcript(video_id)
         return None, None
-            
     except Exception as e:
-        print(f"Error retrieving transcript: {e}")
+        if _is_rate_limit_error(e):
+            raise                   # let the caller back off and retry
+        logger.error("Error retrieving transcript: %s", e)
         return None, None
 
+def _transcript_to_columnar(transcript):
+    """
+    Convert transcript segments into column-oriented form.
+
+    The per-segment dicts returned by the transcript API cost a dict per
+    segment; parallel columns are far more compact and let downstream code
+    slice timestamps in bulk. Timestamps become float32 NumPy arrays when
+    NumPy is installed, plain lists otherwise.
+
+    Args:
+        transcript (list): Segment dicts with 'text', 'start' and 'duration'
+
+    Returns:
+        dict: {'text': list, 'start': array/list, 'duration': array/list}
+    """
+    columnar = {"text": list(map(_get_text, transcript))}
+    if np is not None:
+        count = len(transcript)
+        columnar["start"] = np.fromiter(
+            (s["start"] for s in transcript), dtype=np.float32, count=count)
+        columnar["duration"] = np.fromiter(
+            (s["duration"] for s in transcript), dtype=np.float32, count=count)
+    else:
+        columnar["start"] = [s["start"] for s in transcript]
+        columnar["duration"] = [s["duration"] for s in transcript]
+    return columnar
+
+def transcript_segments(transcript):
+    """
+    Yield segments of a columnar transcript in the original dict shape.
+
+    Args:
+        transcript (dict): Columnar transcript from _transcript_to_columnar
+
+    Yields:
+        dict: {'text': ..., 'start': ..., 'duration': ...} per segment
+    """
+    for text, start, duration in zip(
+            transcript["text"], transcript["start"], transcript["duration"]):
+        yield {"text": text, "start": float(start), "duration": float(duration)}
+
+def _get_video_transcript_cached(video_id, languages=None):
+    """
+    Cached wrapper around get_video_transcript.
+
+    Args:
+        video_id (str): YouTube video ID
+        languages (list): List of preferred language codes for transcript
+
+    Returns:
+        tuple: (list of normalized segment dicts, language code) or
+               (None, None) if not available
+    """
+    key = 'transcript:{}:{}'.format(
+        video_id, ','.join(languages or DEFAULT_TRANSCRIPT_LANGUAGES))
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    transcript, lang = get_video_transcript(video_id, languages)
+    if transcript is not None:
+        _cache_set(key, (transcript, lang))
+    return transcript, lang
+
+def _extract_ydl_info(url, video_id):
+    """
+    Extract the metadata fields for a video with yt-dlp, using the cache.
+
+    Args:
+        url (str): YouTube video URL
+        video_id (str): YouTube video ID extracted from the URL
+
+    Returns:
+        dict: Dictionary of metadata fields (without transcript)
+    """
+    key = 'info:' + video_id
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    # Extract info with the shared yt-dlp instance
+    info = _YDL.extract_info(url, download=False)
+
+    # Cache only the fields we use, not the full yt-dlp info dict
+    metadata = {out_field: info.get(info_field) for out_field, info_field in _FIELD_MAP}
+    metadata["video_id"] = video_id
+    _cache_set(key, metadata)
+    return metadata
+
 def extract_youtube_metadata(url, transcript_languages=None):
     """
     Extract all available metadata from a YouTube video using yt-dlp.
-    
+
     Args:
         url (str): YouTube video URL
         transcript_languages (list): List of preferred language codes for transcript
-        
+
     Returns:
         dict: Dictionary containing all extracted metadata
     """
-    # Extract video ID from URL
+    # Scheme-less URLs like 'youtube.com/watch?v=...' parse with no hostname;
+    # give them a scheme so the domain gate and extract_video_id agree
+    if url and '//' not in url:
+        url = 'https://' + url
+
+    # Screen the domain first: a lookalike URL that happens to carry an
+    # 11-character ID-shaped segment would otherwise still reach yt-dlp and
+    # pay a network round-trip before failing
+    if urlparse(url).hostname not in _YOUTUBE_HOSTNAMES:
+        raise ValueError("Not a YouTube URL")
+
+    # Extract video ID from URL (validated as 11 chars of [A-Za-z0-9_-])
     video_id = extract_video_id(url)
     if not video_id:
         raise ValueError("Invalid YouTube URL or could not extract video ID")
-    
+
     try:
-        # Configure yt-dlp options
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,
-            'ignoreerrors': True,
-        }
-        
-        # Extract info with yt-dlp
-        with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-        
-        # Create metadata dictionary
-        metadata = {
-            "video_id": video_id,
-            "title": info.get('title'),
-            "description": info.get('description'),
-            "views": info.get('view_count'),
-            "publish_date": info.get('upload_date'),
-            "length": info.get('duration'),
-            "author": info.get('uploader'),
-            "channel_id": info.get('channel_id'),
-            "channel_url": info.get('channel_url'),
-            "thumbnail_url": info.get('thumbnail'),
-            "categories": info.get('categories'),
-            "tags": info.get('tags'),
-            "likes": info.get('like_count'),
-        }
-        
-        # Get transcript
-        transcript, lang = get_video_transcript(video_id, transcript_languages)
+        # The yt-dlp extraction and the transcript fetch are independent
+        # given the video ID, so overlap the two network waits; both release
+        # the GIL around their socket reads
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(_extract_ydl_info, url, video_id)
+            transcript_future = executor.submit(
+                _get_video_transcript_cached, video_id, transcript_languages)
+            # Copy so callers can mutate the result without touching the cache
+            metadata = dict(info_future.result())
+            transcript, lang = transcript_future.result()
         if transcript:
-            metadata["transcript"] = transcript
+            metadata["transcript"] = _transcript_to_columnar(transcript)
             metadata["transcript_language"] = lang
             # Create a full transcript text for convenience
-            metadata["transcript_text"] = " ".join([item["text"] for item in transcript])
+            metadata["transcript_text"] = " ".join(metadata["transcript"]["text"])
         
         return metadata
     
     except Exception as e:
-        print(f"Error extracting metadata: {e}")
+        if _is_rate_limit_error(e):
+            raise                   # let the caller back off and retry
+        logger.error("Error extracting metadata: %s", e)
         return None
 
+def extract_youtube_metadata_many(urls, transcript_languages=None, workers=8):
+    """
+    Extract metadata for several YouTube videos concurrently.
+
+    Extraction is network-bound, so a thread pool overlaps the round-trips
+    to YouTube instead of paying them one after another.
+
+    Args:
+        urls (list): YouTube video URLs
+        transcript_languages (list): List of preferred language codes for transcript
+        workers (int): Maximum number of concurrent extractions
+
+    Returns:
+        list: One metadata dict per URL, or None where extraction failed
+    """
+    def extract_one(url):
+        delay = _RATE_LIMIT_BACKOFF
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            try:
+                return extract_youtube_metadata(url, transcript_languages)
+            except ValueError as e:
+                logger.warning("Skipping %s: %s", url, e)
+                return None
+            except Exception as e:
+                # Only rate-limit errors propagate out of the extraction;
+                # back off before retrying so the whole pool slows down
+                if attempt == _RATE_LIMIT_RETRIES:
+                    break
+                logger.warning("Rate limited on %s, retrying in %.0fs: %s", url, delay, e)
+                time.sleep(delay)
+                delay *= 2
+        logger.error("Giving up on %s after %d rate-limited attempts", url, _RATE_LIMIT_RETRIES + 1)
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_one, urls))
+
+def _is_playlist_url(url):
+    """
+    Check whether a URL points at a playlist or channel rather than a video.
+
+    Args:
+        url (str): YouTube URL
+
+    Returns:
+        bool: True for playlist, channel and handle URLs
+    """
+    parsed = urlparse(url)
+    if parsed.hostname not in _YOUTUBE_HOSTNAMES or parsed.hostname == 'youtu.be':
+        return False
+    path = parsed.path
+    return (path.startswith('/playlist')
+            or path.startswith('/channel/')
+            or path.startswith('/@'))
+
+def list_playlist_video_urls(url):
+    """
+    List the video URLs of a playlist or channel with one flat extraction.
+
+    YouTube's initial page load and JS-player resolution happen once for the
+    whole playlist, instead of once per video.
+
+    Args:
+        url (str): Playlist or channel URL
+
+    Returns:
+        list: Watch URLs for the entries
+    """
+    info = _YDL_FLAT.extract_info(url, download=False)
+    entries = (info or {}).get('entries') or []
+    return ['https://www.youtube.com/watch?v=' + entry['id']
+            for entry in entries
+            if entry.get('id') and _VALID_ID_RE.fullmatch(entry['id'])]
+
+def extract_playlist_metadata(url, transcript_languages=None, workers=8):
+    """
+    Extract metadata for every video in a playlist or channel.
+
+    Args:
+        url (str): Playlist or channel URL
+        transcript_languages (list): List of preferred language codes for transcript
+        workers (int): Maximum number of concurrent extractions
+
+    Returns:
+        list: One metadata dict per video, or None where extraction failed
+    """
+    return extract_youtube_metadata_many(
+        list_playlist_video_urls(url), transcript_languages, workers=workers)
+
 def display_metadata(metadata):
     """
     Display the extracted metadata in a readable format.
@@ -154,64 +542,141 @@ def display_metadata(metadata):
     Args:
         metadata (dict): The extracted metadata
     """
-    if metadata:
-        print("\n--- Video Metadata ---")
-        print(f"Title: {metadata['title']}")
-        print(f"Author: {metadata['author']}")
-        print(f"Views: {metadata['views']}")
-        print(f"Publish Date: {metadata['publish_date']}")
-        print(f"Length: {metadata['length']} seconds")
-        
-        print("\n--- Description ---")
-        print(metadata['description'])
-        
-        if metadata.get('tags'):
-            print("\n--- Tags ---")
-            print(", ".join(metadata['tags']))
-        
-        if metadata.get('transcript'):
-            lang = metadata.get('transcript_language', 'unknown')
-            print(f"\n--- Transcript (language: {lang}, first 3 segments) ---")
-            for segment in metadata['transcript'][:3]:
-                print(f"[{segment['start']:.1f}s]: {segment['text']}")
-            print("...[truncated]...")
+    if not metadata:
+        return
+
+    # Assemble the whole report and write it in one shot rather than one
+    # line-buffered print call (and potential flush) per line
+    lines = [
+        "\n--- Video Metadata ---",
+        f"Title: {metadata['title']}",
+        f"Author: {metadata['author']}",
+        f"Views: {metadata['views']}",
+        f"Publish Date: {metadata['publish_date']}",
+        f"Length: {metadata['length']} seconds",
+        "",
+        "--- Description ---",
+        f"{metadata['description']}",
+    ]
+
+    if metadata.get('tags'):
+        lines += ["", "--- Tags ---", ", ".join(metadata['tags'])]
+
+    if metadata.get('transcript'):
+        lang = metadata.get('transcript_language', 'unknown')
+        lines += ["", f"--- Transcript (language: {lang}, first 3 segments) ---"]
+        for segment in islice(transcript_segments(metadata['transcript']), 3):
+            lines.append(f"[{segment['start']:.1f}s]: {segment['text']}")
+        lines.append("...[truncated]...")
 
-def save_to_json(metadata, output_file):
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _json_default(obj):
+    """
+    Serialize objects stdlib json does not handle (NumPy timestamp arrays).
+    """
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def save_to_json(metadata, output_file, compact=False):
     """
     Save metadata to a JSON file.
-    
+
     Args:
         metadata (dict): The metadata to save
-        output_file (str): Path to the output file
+        output_file (str): Path to the output file, or '-' for stdout
+        compact (bool): Write compact JSON (no indentation) for machine
+                        consumption; smaller and faster to encode
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
-    print(f"Metadata saved to {output_file}")
+    to_stdout = output_file == '-'
+    # Piped stdout is machine-consumed, so skip the indentation work there
+    if to_stdout and not sys.stdout.isatty():
+        compact = True
+
+    if orjson is not None:
+        # orjson encodes straight to UTF-8 bytes, so write in binary mode;
+        # OPT_SERIALIZE_NUMPY turns columnar timestamp arrays into lists
+        option = orjson.OPT_SERIALIZE_NUMPY | (0 if compact else orjson.OPT_INDENT_2)
+        data = orjson.dumps(metadata, option=option)
+        if to_stdout:
+            sys.stdout.buffer.write(data + b'\n')
+        else:
+            with open(output_file, 'wb') as f:
+                f.write(data)
+    else:
+        kwargs = {'ensure_ascii': False, 'default': _json_default}
+        if compact:
+            kwargs['separators'] = (',', ':')
+        else:
+            kwargs['indent'] = 2
+        if to_stdout:
+            json.dump(metadata, sys.stdout, **kwargs)
+            sys.stdout.write('\n')
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, **kwargs)
+    if not to_stdout:
+        print(f"Metadata saved to {output_file}")
 
 def main():
     """
     Main function to handle command-line arguments and execute the metadata extraction.
     """
+    # Keep diagnostics visible for CLI use; library users configure logging
+    logging.basicConfig(format='%(message)s', level=logging.INFO)
+
     parser = argparse.ArgumentParser(description='Extract metadata from YouTube videos')
-    parser.add_argument('url', nargs='?', help='YouTube video URL')
-    parser.add_argument('--output', '-o', help='Output JSON file path')
-    parser.add_argument('--languages', '-l', nargs='+', default=['en', 'hi'], 
+    parser.add_argument('urls', nargs='*', help='YouTube video URL(s)')
+    parser.add_argument('--urls-file', '-f', help='File containing one YouTube URL per line')
+    parser.add_argument('--output', '-o', help="Output JSON file path, or '-' for stdout")
+    parser.add_argument('--languages', '-l', nargs='+', default=['en', 'hi'],
                         help='Preferred transcript languages (space-separated language codes, e.g., "en hi")')
-    
+    parser.add_argument('--workers', '-w', type=int, default=8,
+                        help='Number of concurrent extractions when given multiple URLs')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write compact JSON output without indentation')
+
     args = parser.parse_args()
-    
-    # If URL is not provided as argument, prompt for it
-    if args.url:
-        url = args.url
+
+    # Collect URLs from arguments and/or file; prompt if none were provided
+    urls = list(args.urls)
+    if args.urls_file:
+        with open(args.urls_file, encoding='utf-8') as f:
+            urls.extend(line.strip() for line in f if line.strip())
+    if not urls:
+        urls = [input("Enter YouTube video URL: ")]
+
+    # Qualify scheme-less URLs up front so playlist detection, the hostname
+    # gate and yt-dlp all see the same fully qualified URL
+    urls = ['https://' + url if url and '//' not in url else url for url in urls]
+
+    # Expand playlist/channel URLs into their videos first; one flat listing
+    # per playlist, then everything goes through the same concurrent path
+    video_urls = []
+    for url in urls:
+        if _is_playlist_url(url):
+            video_urls.extend(list_playlist_video_urls(url))
+        else:
+            video_urls.append(url)
+    urls = video_urls
+
+    # Go through the batch path even for one URL so rate-limit retries and
+    # invalid-URL handling behave the same everywhere
+    results = extract_youtube_metadata_many(urls, args.languages, workers=args.workers)
+    if len(urls) == 1:
+        metadata = results[0]
     else:
-        url = input("Enter YouTube video URL: ")
-    
-    metadata = extract_youtube_metadata(url, args.languages)
-    
+        # Keep only the URLs that extracted successfully
+        metadata = [m for m in results if m]
+
     if metadata:
         # Save to JSON if output path is provided
         if args.output:
-            save_to_json(metadata, args.output)
+            save_to_json(metadata, args.output, compact=args.compact)
+        elif isinstance(metadata, list):
+            for item in metadata:
+                display_metadata(item)
         else:
             # Display metadata if not saving to file
             display_metadata(metadata)